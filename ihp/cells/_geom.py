@@ -0,0 +1,32 @@
+"""Geometry helpers shared by IHP cells."""
+
+import math
+
+import numpy as np
+
+# Vertices of a regular octagon with unit circumradius, rotated by 22.5° so
+# that its sides are axis-aligned.
+OCT_UNIT_45_OFFSET: np.ndarray = np.array(
+    [
+        (
+            math.cos(math.pi / 8 + i * math.pi / 4),
+            math.sin(math.pi / 8 + i * math.pi / 4),
+        )
+        for i in range(8)
+    ]
+)
+OCT_UNIT_45_OFFSET.flags.writeable = False
+
+
+def oct_polygon(radius: float, cx: float = 0, cy: float = 0) -> np.ndarray:
+    """Return the vertices of a regular octagon with axis-aligned sides.
+
+    Args:
+        radius: Circumradius of the octagon in micrometers.
+        cx: x coordinate of the center in micrometers.
+        cy: y coordinate of the center in micrometers.
+
+    Returns:
+        Array of shape (8, 2) with the vertices in counter-clockwise order.
+    """
+    return OCT_UNIT_45_OFFSET * radius + (cx, cy)
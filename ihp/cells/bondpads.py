@@ -1,28 +1,41 @@
 """Bondpad components for IHP PDK."""
 
 import math
+from functools import lru_cache
 from typing import Literal
 
 import gdsfactory as gf
+import numpy as np
 from gdsfactory import Component
 from gdsfactory.typings import LayerSpec
 from kfactory.schematic import DSchematic
 
+from ._geom import oct_polygon
+
 _XS = "metal1_routing"
 
+# Ratio of the across-flats diameter of a regular octagon to its side length.
+_OCT_DIAMETER_PER_SIDE = 1 + math.sqrt(2)
+# Ratio of the side length of a regular octagon to its circumradius.
+_OCT_SIDE_PER_RADIUS = 2 * math.sin(math.pi / 8)
 
-def regular_octagon_points(diameter: float):
-    """Create a regular octagon"""
-    side = diameter / (1 + math.sqrt(2))
-    R = side / (2 * math.sin(math.pi / 8))
-    start_angle = math.pi / 8
-    return [
-        (
-            R * math.cos(start_angle + i * math.pi / 4),
-            R * math.sin(start_angle + i * math.pi / 4),
-        )
-        for i in range(8)
-    ]
+
+@lru_cache(maxsize=256)
+def regular_octagon_points(diameter: float) -> np.ndarray:
+    """Create a regular octagon.
+
+    The vertices are memoized per diameter, so pads and their bbox layers
+    sharing a size are only computed once.
+
+    Returns:
+        Array of shape (8, 2) with the vertices. It is shared between callers
+        and therefore read-only; copy it before modifying.
+    """
+    side = diameter / _OCT_DIAMETER_PER_SIDE
+    R = side / _OCT_SIDE_PER_RADIUS
+    pts = np.ascontiguousarray(oct_polygon(R))
+    pts.flags.writeable = False
+    return pts
 
 
 def bondpad_schematic(
@@ -88,8 +101,7 @@ def bondpad(
         )
 
     elif shape == "octagon":
-        pts = regular_octagon_points(d)
-        c.add_polygon(points=pts, layer=layer_top_metal)
+        c.add_polygon(points=regular_octagon_points(d), layer=layer_top_metal)
 
     elif shape == "circle":
         c.add_ref(gf.components.circle(radius=d / 2, layer=layer_top_metal))
@@ -151,7 +163,8 @@ def bondpad_array(
 
     Args:
         n_pads: Number of bondpads.
-        pad_pitch: Pitch between bondpad centers in micrometers.
+        pad_pitch: Pitch between bondpad centers in micrometers, snapped to
+            the database unit.
         pad_diameter: Diameter of each bondpad in micrometers.
         shape: Shape of the bondpads.
         layer_top_metal: Top metal layer for the bondpad.
@@ -164,26 +177,33 @@ def bondpad_array(
     """
     c = Component()
 
-    for i in range(n_pads):
-        pad = bondpad(
-            shape=shape,
-            diameter=pad_diameter,
-            layer_top_metal=layer_top_metal,
-            layer_top_metal_pin=layer_top_metal_pin,
-            layer_passiv=layer_passiv,
-            layer_dfpad=layer_dfpad,
-            bbox_offsets=bbox_offsets,
-        )
-        pad_ref = c.add_ref(pad)
-        pad_ref.movex(i * pad_pitch)
-
-        # Add port for each pad
-        c.add_port(
-            name=f"pad_{i + 1}",
-            center=(i * pad_pitch, 0),
+    pad = bondpad(
+        shape=shape,
+        diameter=pad_diameter,
+        layer_top_metal=layer_top_metal,
+        layer_top_metal_pin=layer_top_metal_pin,
+        layer_passiv=layer_passiv,
+        layer_dfpad=layer_dfpad,
+        bbox_offsets=bbox_offsets,
+    )
+    # Place all pads with a single array reference. The array applies one
+    # pitch to every column, so snap it to the database unit up front and
+    # use the same value for the port centers.
+    pitch = gf.snap.snap_to_grid(pad_pitch)
+    c.add_ref(pad, columns=n_pads, rows=1, column_pitch=pitch)
+
+    # Add port for each pad
+    add_port = c.add_port
+    layer = pad.ports["pad"].layer
+    names = [f"pad_{i + 1}" for i in range(n_pads)]
+    centers = (np.arange(n_pads) * pitch).tolist()
+    for name, x in zip(names, centers):
+        add_port(
+            name=name,
+            center=(x, 0),
             width=pad_diameter,
             orientation=0,
-            layer=pad.ports["pad"].layer,
+            layer=layer,
             port_type="electrical",
         )
 
@@ -1,296 +1,406 @@
 """Inductor components for IHP PDK."""
 
 import math
+from functools import lru_cache
 
 import gdsfactory as gf
+import klayout.db as kdb
+import numpy as np
 from gdsfactory import Component
 from gdsfactory.typings import LayerSpec, LayerSpecs
 
+from ._geom import oct_polygon
 
-def snap_to_grid(p, grid: float = 0.005):
-    return round(p / grid) * grid
+# Inductors are drawn on a 5 nm grid. Grid step counts are converted back by
+# multiplying with the grid rather than dividing by the steps per micrometer,
+# so that lengths landing on half a database unit keep rounding the same way.
+_GRID = 0.005
+# Decimal places of the grid, for turning snapped lengths into clean floats.
+_GRID_DECIMALS = 3
 
+# Trigonometry of the 22.5° half vertex angle of the octagonal turns.
+_COS_PI_8 = math.cos(math.pi / 8)
+_TAN_PI_8 = math.tan(math.pi / 8)
+
+
+def _to_grid_steps(p: float, multiple: int = 1) -> int:
+    """Round a length in micrometers to an integer number of grid steps.
+
+    Args:
+        p: Length in micrometers.
+        multiple: Snap to a multiple of this many grid steps.
+    """
+    return multiple * round(p / (multiple * _GRID))
 
-@gf.cell(tags=["IHP", "inductor"])
-def inductor2(
-    width: float = 2.0,
-    space: float = 2.1,
-    diameter: float = 25.35,
-    vias_width: float = 0.9,
-    resistance: float = 0.5777,
-    inductance: float = 33.303e-12,
-    terminal_1_length: float = 30.0,
-    turns: int = 1,
-    layer_metal_1: LayerSpec = "TopMetal1drawing",
-    layer_metal_2: LayerSpec = "TopMetal2drawing",
-    layer_inductor: LayerSpec = "INDdrawing",
-    layer_metal_1_pin: LayerSpec = "TopMetal1pin",
-    layer_metal_2_pin: LayerSpec = "TopMetal2pin",
-    layer_ind_pin: LayerSpec = "INDpin",
-    layer_via: LayerSpec = "TopVia2drawing",
-    layers_no_fill: LayerSpecs = (
-        "Activnofill",
-        "GatPolynofill",
-        "Metal1nofill",
-        "Metal2nofill",
-        "Metal3nofill",
-        "Metal4nofill",
-        "Metal5nofill",
-        "TopMetal1nofill",
-        "TopMetal2nofill",
-        "PWellblock",
-        "NoRCXdrawing",
-    ),
-) -> Component:
-    """Create a 2-turn inductor.
+
+@lru_cache(maxsize=128)
+def inductor_min_diameter(width: float, space: float, turns: int) -> float:
+    """Calculate the minimum inner diameter of an inductor.
+
+    Below this diameter the innermost semi-octagon sides are shorter than the
+    terminal offset, so the turns fold back onto themselves.
 
     Args:
         width: Width of the inductor trace in micrometers.
         space: Space between turns in micrometers.
-        diameter: Inner diameter in micrometers.
-        vias_width: Width of vias in micrometers (only when turns > 2)
-        resistance: Resistance in ohms.
-        inductance: Inductance in henries.
-        terminal_1_length: Length of the shorter terminal
-        turns: Number of turns (default 1 for inductor2).
+        turns: Number of turns.
 
     Returns:
-        Component with inductor layout.
+        Minimum inner diameter in micrometers, rounded up to twice the grid.
     """
-    if not isinstance(turns, int) or turns < 1:
-        raise ValueError("turns must be an integer >= 1")
+    terminal_offset = space / 2 if turns == 1 else space + width / 2
+    min_d = 2 * terminal_offset / _TAN_PI_8
+    min_d_steps = 2 * math.ceil(min_d / (2 * _GRID))
+    return round(min_d_steps * _GRID, _GRID_DECIMALS)
 
-    c = Component()
 
-    Pin_layers_1 = [layer_metal_1_pin, layer_ind_pin]
-    Pin_layers_2 = [layer_metal_2_pin, layer_ind_pin]
+@lru_cache(maxsize=256)
+def _outline_points(octagon_center_offset_y: float) -> np.ndarray:
+    """Vertices of the octagonal outline enclosing the inductor body.
 
-    w = snap_to_grid(width, grid=0.005 * 2)
-    s = snap_to_grid(space)
-    d = snap_to_grid(diameter, grid=0.005 * 2)
+    Memoized on the octagon center, which is the only geometric input of the
+    outline, so inductors sharing a footprint reuse the same vertices. The
+    returned array is shared between callers and therefore read-only.
+    """
+    r_outer = octagon_center_offset_y / _COS_PI_8
 
-    apothem_innermost = d / 2
-    vertex_angle = math.pi / 4.0  # 45°
-    half_vertex_angle = vertex_angle / 2  # 22.5°
+    pts = oct_polygon(r_outer, cy=octagon_center_offset_y)
+    pts = np.ascontiguousarray(np.round(pts / _GRID) * _GRID)
+    pts.flags.writeable = False
+    return pts
 
-    length_short_terminal = terminal_1_length
-    length_long_terminal = length_short_terminal + w + (w + s) * (turns - 1)
 
-    octagon_center_offset_y = length_long_terminal + apothem_innermost
+def _box(x: float, y: float, width: float, height: float, dbu: float) -> kdb.Box:
+    """Rectangle with its lower-left corner at (x, y), in database units.
 
-    # Add inductor layer
-    outer_polygon_pts = []
-    for i in range(8):
-        r_outer = octagon_center_offset_y / math.cos(half_vertex_angle)
-        angle = i * vertex_angle + half_vertex_angle
+    Rounded the way a gf.components.rectangle placed with move() is: the size
+    is snapped to twice the database unit, and the shift to the rectangle
+    center and the placement offset are each rounded to the database unit
+    separately. This keeps half-dbu coordinates on the same side as before.
+    """
+    half_width = round(gf.snap.snap_to_grid2x(width) / (2 * dbu))
+    half_height = round(gf.snap.snap_to_grid2x(height) / (2 * dbu))
+    center = kdb.DPoint(width / 2, height / 2).to_itype(dbu) + kdb.DVector(
+        x, y
+    ).to_itype(dbu)
+    return kdb.Box(
+        center.x - half_width,
+        center.y - half_height,
+        center.x + half_width,
+        center.y + half_height,
+    )
 
-        x = snap_to_grid(r_outer * math.cos(angle))
-        y = snap_to_grid(r_outer * math.sin(angle) + octagon_center_offset_y)
-        outer_polygon_pts.append((x, y))
-    c.add_polygon(points=outer_polygon_pts, layer=layer_inductor)
 
-    # Add No fill layers
-    for layer in layers_no_fill:
-        c.add_polygon(points=outer_polygon_pts, layer=layer)
+def _trace(
+    points: list[tuple[float, float]] | np.ndarray, width: float, dbu: float
+) -> kdb.Polygon:
+    """Constant-width trace along points, in database units.
 
-    # Handle the terminals and pins of the inductor
-    if turns == 1:
-        port1_single_turn = c << gf.components.rectangle(
-            size=(w, length_short_terminal + w), layer=layer_metal_2
-        )
-        port1_single_turn.move((-w - s / 2, 0))
-        c.add_port(
-            name="P1",
-            center=(-w / 2 - s / 2, 0),
-            width=w,
-            orientation=270,
-            layer=layer_metal_2_pin,
-            port_type="electrical",
+    The outline is built from the same offset curves as gf.path.extrude, so
+    sharp and doubling-back corners come out identical, but without creating
+    a child cell per trace.
+    """
+    path = gf.Path(points)
+    sides = [
+        path.centerpoint_offset_curve(
+            path.points,
+            offset_distance=offset,
+            start_angle=path.start_angle,
+            end_angle=path.end_angle,
         )
+        for offset in (width / 2, -width / 2)
+    ]
+    outline = np.concatenate([sides[0], sides[1][::-1]]).tolist()
+    return kdb.DPolygon([kdb.DPoint(x, y) for x, y in outline]).to_itype(dbu)
+
+
+@lru_cache(maxsize=128)
+def _inductor2_regions(
+    w_steps: int,
+    s_steps: int,
+    d_steps: int,
+    vias_width: float,
+    terminal_1_length: float,
+    turns: int,
+    dbu: float,
+) -> dict[str, kdb.Region]:
+    """Geometry of inductor2 as KLayout regions keyed by layer role.
+
+    The geometry only depends on the snapped dimensions, so it is built once
+    per parameter set and stamped into every inductor2 cell using it. The
+    returned regions are shared and must not be modified.
 
-        for layer in Pin_layers_2:
-            pin_1_trace = c << gf.components.rectangle(size=(w, w), layer=layer)
-            pin_1_trace.move((-w - s / 2, 0))
+    Args:
+        w_steps: Trace width in grid steps.
+        s_steps: Space between turns in grid steps.
+        d_steps: Inner diameter in grid steps.
+        vias_width: Width of vias in micrometers.
+        terminal_1_length: Length of the shorter terminal in micrometers.
+        turns: Number of turns.
+        dbu: Database unit of the target layout in micrometers.
 
-        port2_single_turn = c << gf.components.rectangle(
-            size=(w, length_short_terminal + w), layer=layer_metal_2
-        )
-        port2_single_turn.move((s / 2, 0))
-        c.add_port(
-            name="P2",
-            center=(w / 2 + s / 2, 0),
-            width=w,
-            orientation=270,
-            layer=layer_metal_2_pin,
-            port_type="electrical",
+    Returns:
+        Regions for the "outline", "metal_1", "metal_2", "metal_1_pin",
+        "metal_2_pin", "ind_pin" and "via" roles.
+    """
+    regions = {
+        role: kdb.Region()
+        for role in (
+            "outline",
+            "metal_1",
+            "metal_2",
+            "metal_1_pin",
+            "metal_2_pin",
+            "ind_pin",
+            "via",
         )
+    }
 
-        for layer in Pin_layers_2:
-            pin_2_trace = c << gf.components.rectangle(size=(w, w), layer=layer)
-            pin_2_trace.move((s / 2, 0))
-    else:
-        port_short = c << gf.components.rectangle(
-            size=(w, length_short_terminal), layer=layer_metal_2
-        )
-        port_short.move((-w / 2, 0))
-        c.add_port(
-            name="P1",
-            center=(0, 0),
-            width=w,
-            orientation=270,
-            layer=layer_metal_2_pin,
-            port_type="electrical",
-        )
+    w = w_steps * _GRID
+    s = s_steps * _GRID
+    d = d_steps * _GRID
 
-        for layer in Pin_layers_2:
-            pin_short_trace = c << gf.components.rectangle(size=(w, w), layer=layer)
-            pin_short_trace.move((-w / 2, 0))
+    half_w = w / 2
+    half_s = s / 2
+    pitch = w + s
 
-        port_long_1 = c << gf.components.rectangle(
-            size=(w, length_long_terminal), layer=layer_metal_1
-        )
-        port_long_1.move((-(w + s) - w / 2, 0))
-        c.add_port(
-            name="P2",
-            center=(-(w + s), 0),
-            width=w,
-            orientation=270,
-            layer=layer_metal_1_pin,
-            port_type="electrical",
-        )
+    apothem_innermost = d / 2
 
-        for layer in Pin_layers_1:
-            pin_long1_trace = c << gf.components.rectangle(size=(w, w), layer=layer)
-            pin_long1_trace.move((-(w + s) - w / 2, 0))
+    length_short_terminal = terminal_1_length
+    length_long_terminal = length_short_terminal + w + pitch * (turns - 1)
 
-        port_long_2 = c << gf.components.rectangle(
-            size=(w, length_long_terminal), layer=layer_metal_1
-        )
-        port_long_2.move(((w + s) - w / 2, 0))
-        c.add_port(
-            name="P3",
-            center=(w + s, 0),
-            width=w,
-            orientation=270,
-            layer=layer_metal_1_pin,
-            port_type="electrical",
-        )
+    octagon_center_offset_y = length_long_terminal + apothem_innermost
+
+    # Add inductor and No fill layers
+    outer_polygon_pts = _outline_points(octagon_center_offset_y).tolist()
+    regions["outline"].insert(
+        kdb.DPolygon([kdb.DPoint(x, y) for x, y in outer_polygon_pts]).to_itype(dbu)
+    )
 
-        for layer in Pin_layers_1:
-            pin_long1_trace = c << gf.components.rectangle(size=(w, w), layer=layer)
-            pin_long1_trace.move((w + s - w / 2, 0))
+    # Handle the terminals and pins of the inductor
+    if turns == 1:
+        for x in (-w - half_s, half_s):
+            regions["metal_2"].insert(_box(x, 0, w, length_short_terminal + w, dbu))
+            pin = _box(x, 0, w, w, dbu)
+            regions["metal_2_pin"].insert(pin)
+            regions["ind_pin"].insert(pin)
+    else:
+        regions["metal_2"].insert(_box(-half_w, 0, w, length_short_terminal, dbu))
+        pin = _box(-half_w, 0, w, w, dbu)
+        regions["metal_2_pin"].insert(pin)
+        regions["ind_pin"].insert(pin)
+
+        for x in (-pitch - half_w, pitch - half_w):
+            regions["metal_1"].insert(_box(x, 0, w, length_long_terminal, dbu))
+            pin = _box(x, 0, w, w, dbu)
+            regions["metal_1_pin"].insert(pin)
+            regions["ind_pin"].insert(pin)
 
     # We break down the body of inductor into 3 sections
     for k in range(turns):
-        apothem = (apothem_innermost + w / 2) + (w + s) * k
-        half_octagon_side = apothem * math.tan(half_vertex_angle)
+        apothem = (apothem_innermost + half_w) + pitch * k
+        half_octagon_side = apothem * _TAN_PI_8
 
         # Step 1a: We handle the left semi-octagon loops
-        x = (-s / 2) if turns == 1 else (-s - w / 2)
-        left_octagon_fragment = [
-            (x, octagon_center_offset_y + apothem),
-            (-half_octagon_side, octagon_center_offset_y + apothem),
-            (-apothem, octagon_center_offset_y + half_octagon_side),
-            (-apothem, octagon_center_offset_y - half_octagon_side),
-            (-half_octagon_side, octagon_center_offset_y - apothem),
-            (x, octagon_center_offset_y - apothem),
-        ]
+        x = -half_s if turns == 1 else -s - half_w
+        left_octagon_fragment = np.empty((6, 2))
+        left_octagon_fragment[:, 0] = (
+            x,
+            -half_octagon_side,
+            -apothem,
+            -apothem,
+            -half_octagon_side,
+            x,
+        )
+        left_octagon_fragment[:, 1] = (
+            apothem,
+            apothem,
+            half_octagon_side,
+            -half_octagon_side,
+            -apothem,
+            -apothem,
+        )
+        left_octagon_fragment[:, 1] += octagon_center_offset_y
 
-        left_path = gf.Path(left_octagon_fragment)
-        _ = c << gf.path.extrude(left_path, layer=layer_metal_2, width=w)
-
-        # Step 1b: We handle the right semi-octagon loops
-        x = (s / 2) if turns == 1 else (s + w / 2)
-        right_octagon_fragment = [
-            (x, octagon_center_offset_y + apothem),
-            (half_octagon_side, octagon_center_offset_y + apothem),
-            (apothem, octagon_center_offset_y + half_octagon_side),
-            (apothem, octagon_center_offset_y - half_octagon_side),
-            (half_octagon_side, octagon_center_offset_y - apothem),
-            (x, octagon_center_offset_y - apothem),
-        ]
+        regions["metal_2"].insert(_trace(left_octagon_fragment, w, dbu))
+
+        # Step 1b: The right semi-octagon loops mirror the left ones
+        right_octagon_fragment = left_octagon_fragment * (-1, 1)
 
-        right_path = gf.Path(right_octagon_fragment)
-        _ = c << gf.path.extrude(right_path, layer=layer_metal_2, width=w)
+        regions["metal_2"].insert(_trace(right_octagon_fragment, w, dbu))
 
         # Step 2: We handle the connections of the loops within TM2
         if turns == 1:
             center_fragment = [
-                (-w - s / 2, octagon_center_offset_y + apothem),
-                (w + s / 2, octagon_center_offset_y + apothem),
+                (-w - half_s, octagon_center_offset_y + apothem),
+                (w + half_s, octagon_center_offset_y + apothem),
             ]
-            center_path = gf.Path(center_fragment)
-            _ = c << gf.path.extrude(center_path, layer=layer_metal_2, width=w)
+            regions["metal_2"].insert(_trace(center_fragment, w, dbu))
         else:
             if k == 0:
                 continue
 
             center_fragment = [
-                (-s - w / 2, octagon_center_offset_y - apothem),
-                (s + w / 2, octagon_center_offset_y - apothem),
+                (-s - half_w, octagon_center_offset_y - apothem),
+                (s + half_w, octagon_center_offset_y - apothem),
             ]
-            center_path = gf.Path(center_fragment)
-            c << gf.path.extrude(center_path, layer=layer_metal_2, width=w)
+            regions["metal_2"].insert(_trace(center_fragment, w, dbu))
 
             connecting_fragment_TM2 = [
-                (-s - w / 2, octagon_center_offset_y + apothem - w - s),
+                (-s - half_w, octagon_center_offset_y + apothem - w - s),
                 (-w, octagon_center_offset_y + apothem - w - s),
                 (w, octagon_center_offset_y + apothem),
-                (s + w / 2, octagon_center_offset_y + apothem),
+                (s + half_w, octagon_center_offset_y + apothem),
             ]
 
-            connecting_path_TM2 = gf.Path(connecting_fragment_TM2)
-            c << gf.path.extrude(connecting_path_TM2, layer=layer_metal_2, width=w)
+            regions["metal_2"].insert(_trace(connecting_fragment_TM2, w, dbu))
 
     # Step 3: We handle the cross connection of the loops using TM1 and vias
     if turns > 1:
         connecting_fragment_TM1 = [
-            (-s - w / 2 - w, octagon_center_offset_y + apothem),
+            (-s - half_w - w, octagon_center_offset_y + apothem),
             (-w, octagon_center_offset_y + apothem),
-            (w, octagon_center_offset_y + apothem - (w + s) * (turns - 1)),
-            (s + w / 2 + w, octagon_center_offset_y + apothem - (w + s) * (turns - 1)),
+            (w, octagon_center_offset_y + apothem - pitch * (turns - 1)),
+            (s + half_w + w, octagon_center_offset_y + apothem - pitch * (turns - 1)),
         ]
-        connecting_path_TM1 = gf.Path(connecting_fragment_TM1)
-        c << gf.path.extrude(connecting_path_TM1, layer=layer_metal_1, width=w)
+        regions["metal_1"].insert(_trace(connecting_fragment_TM1, w, dbu))
 
-        offset_x = w / 2 - vias_width / 2
+        offset_x = half_w - vias_width / 2
         offset_y = vias_width / 2
 
-        via_1_trace = c << gf.components.rectangle(
-            size=(vias_width, vias_width), layer=layer_via
-        )
-        via_1_trace.move(
-            (-s - w / 2 - w + offset_x, octagon_center_offset_y + apothem - offset_y)
-        )
-
-        via_2_trace = c << gf.components.rectangle(
-            size=(vias_width, vias_width), layer=layer_via
-        )
-        via_2_trace.move(
+        for x, y in (
             (
-                s + w / 2 + offset_x,
-                octagon_center_offset_y + apothem - (w + s) * (turns - 1) - offset_y,
-            )
-        )
-
-        via_3_trace = c << gf.components.rectangle(
-            size=(vias_width, vias_width), layer=layer_via
-        )
-        via_3_trace.move(
+                -s - half_w - w + offset_x,
+                octagon_center_offset_y + apothem - offset_y,
+            ),
+            (
+                s + half_w + offset_x,
+                octagon_center_offset_y + apothem - pitch * (turns - 1) - offset_y,
+            ),
             (
-                -s - w / 2 - w + offset_x,
-                octagon_center_offset_y - apothem + (w + s) * (turns - 1) - offset_y,
-            )
+                -s - half_w - w + offset_x,
+                octagon_center_offset_y - apothem + pitch * (turns - 1) - offset_y,
+            ),
+            (
+                s + half_w + offset_x,
+                octagon_center_offset_y - apothem + pitch * (turns - 1) - offset_y,
+            ),
+        ):
+            regions["via"].insert(_box(x, y, vias_width, vias_width, dbu))
+
+    return regions
+
+
+@gf.cell(tags=["IHP", "inductor"])
+def inductor2(
+    width: float = 2.0,
+    space: float = 2.1,
+    diameter: float = 25.35,
+    vias_width: float = 0.9,
+    resistance: float = 0.5777,
+    inductance: float = 33.303e-12,
+    terminal_1_length: float = 30.0,
+    turns: int = 1,
+    layer_metal_1: LayerSpec = "TopMetal1drawing",
+    layer_metal_2: LayerSpec = "TopMetal2drawing",
+    layer_inductor: LayerSpec = "INDdrawing",
+    layer_metal_1_pin: LayerSpec = "TopMetal1pin",
+    layer_metal_2_pin: LayerSpec = "TopMetal2pin",
+    layer_ind_pin: LayerSpec = "INDpin",
+    layer_via: LayerSpec = "TopVia2drawing",
+    layers_no_fill: LayerSpecs = (
+        "Activnofill",
+        "GatPolynofill",
+        "Metal1nofill",
+        "Metal2nofill",
+        "Metal3nofill",
+        "Metal4nofill",
+        "Metal5nofill",
+        "TopMetal1nofill",
+        "TopMetal2nofill",
+        "PWellblock",
+        "NoRCXdrawing",
+    ),
+) -> Component:
+    """Create a 2-turn inductor.
+
+    Args:
+        width: Width of the inductor trace in micrometers.
+        space: Space between turns in micrometers.
+        diameter: Inner diameter in micrometers.
+        vias_width: Width of vias in micrometers (only when turns > 2)
+        resistance: Resistance in ohms.
+        inductance: Inductance in henries.
+        terminal_1_length: Length of the shorter terminal
+        turns: Number of turns (default 1 for inductor2).
+
+    Returns:
+        Component with inductor layout.
+    """
+    if not isinstance(turns, int) or turns < 1:
+        raise ValueError("turns must be an integer >= 1")
+
+    c = Component()
+
+    # Snap in integer grid steps and convert back to micrometers once, so the
+    # dimensions are exact multiples of the grid. Width and diameter are kept
+    # on a 2x grid so that their halves stay on grid.
+    w_steps = _to_grid_steps(width, 2)
+    s_steps = _to_grid_steps(space)
+    d_steps = _to_grid_steps(diameter, 2)
+
+    # Fail fast instead of drawing self-intersecting turns
+    w = w_steps * _GRID
+    s = s_steps * _GRID
+    min_d = inductor_min_diameter(w, s, turns)
+    if d_steps < _to_grid_steps(min_d, 2):
+        raise ValueError(
+            f"inductor diameter={diameter} below minimum {min_d} "
+            f"for width={width}, space={space}, turns={turns}"
         )
 
-        via_4_trace = c << gf.components.rectangle(
-            size=(vias_width, vias_width), layer=layer_via
+    regions = _inductor2_regions(
+        w_steps, s_steps, d_steps, vias_width, terminal_1_length, turns, c.kcl.dbu
+    )
+    role_layers = {
+        "outline": (layer_inductor, *layers_no_fill),
+        "metal_1": (layer_metal_1,),
+        "metal_2": (layer_metal_2,),
+        "metal_1_pin": (layer_metal_1_pin,),
+        "metal_2_pin": (layer_metal_2_pin,),
+        "ind_pin": (layer_ind_pin,),
+        "via": (layer_via,),
+    }
+    for role, region in regions.items():
+        if region.is_empty():
+            continue
+        for layer in role_layers[role]:
+            c.add_polygon(region, layer=layer)
+
+    # Add ports
+    half_w = w / 2
+    half_s = s / 2
+    pitch = w + s
+
+    if turns == 1:
+        ports = (
+            ("P1", -half_w - half_s, layer_metal_2_pin),
+            ("P2", half_w + half_s, layer_metal_2_pin),
         )
-        via_4_trace.move(
-            (
-                s + w / 2 + offset_x,
-                octagon_center_offset_y - apothem + (w + s) * (turns - 1) - offset_y,
-            )
+    else:
+        ports = (
+            ("P1", 0, layer_metal_2_pin),
+            ("P2", -pitch, layer_metal_1_pin),
+            ("P3", pitch, layer_metal_1_pin),
+        )
+    for name, x, layer in ports:
+        c.add_port(
+            name=name,
+            center=(x, 0),
+            width=w,
+            orientation=270,
+            layer=layer,
+            port_type="electrical",
         )
 
     # Add metadata
@@ -351,6 +461,13 @@ def inductor3(
     Returns:
         Component with inductor layout.
     """
+    # Snap the geometry to the grid inductor2 draws on, so that inputs giving
+    # the same layout resolve to a single cached inductor2 cell. Round away
+    # the float noise of the conversion, as inductor2 stores these as info.
+    width = round(_to_grid_steps(width, 2) * _GRID, _GRID_DECIMALS)
+    space = round(_to_grid_steps(space) * _GRID, _GRID_DECIMALS)
+    diameter = round(_to_grid_steps(diameter, 2) * _GRID, _GRID_DECIMALS)
+
     # Use inductor2 as base with different default parameters
     return inductor2(
         width=width,
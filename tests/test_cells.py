@@ -6,6 +6,7 @@ import pathlib
 
 import gdsfactory as gf
 import jsondiff
+import klayout.db as kdb
 import numpy as np
 import pytest
 from gdsfactory.difftest import difftest
@@ -88,6 +89,60 @@ def test_gds(component_name: str) -> None:
     difftest(component, test_name=component_name, dirpath=dirpath)
 
 
+inductor_variants = {
+    # Trace wider than twice the spacing: the TM2 crossing doubles back
+    "inductor2_wide_T2": dict(width=5.0, space=2.0, diameter=60.0, turns=2),
+    "inductor2_wide_T3": dict(width=5.0, space=2.0, diameter=60.0, turns=3),
+    "inductor2_wide_T4": dict(width=5.0, space=2.0, diameter=60.0, turns=4),
+    "inductor2_wide_W10": dict(width=10.0, space=2.1, diameter=100.0, turns=3),
+    # Half-dbu terminal coordinates (space / 2 = 0.7525)
+    "inductor2_S1p505_T1": dict(width=2.0, space=1.505, diameter=30.0, turns=1),
+    "inductor2_S1p505_T2": dict(width=2.0, space=1.505, diameter=30.0, turns=2),
+    "inductor2_S1p505_T4": dict(width=2.0, space=1.505, diameter=30.0, turns=4),
+}
+
+
+@pytest.mark.parametrize("test_name", sorted(inductor_variants))
+def test_gds_inductor_variants(test_name: str) -> None:
+    """Avoid regressions in inductor geometry outside the default parameters."""
+    component = cells["inductor2"](**inductor_variants[test_name])
+    difftest(
+        component,
+        test_name=test_name,
+        dirpath=dirpath,
+        ignore_sliver_differences=False,
+    )
+
+
+bondpad_variants = {
+    # Bbox offsets below the database unit resolution
+    "bondpad_offgrid_offsets": dict(diameter=97.0, bbox_offsets=(-3.237, -0.7325)),
+}
+
+
+@pytest.mark.parametrize("test_name", sorted(bondpad_variants))
+def test_gds_bondpad_variants(test_name: str) -> None:
+    """Avoid regressions in bondpad geometry outside the default parameters."""
+    component = cells["bondpad"](**bondpad_variants[test_name])
+    difftest(
+        component,
+        test_name=test_name,
+        dirpath=dirpath,
+        ignore_sliver_differences=False,
+    )
+
+    # difftest tolerates 1 dbu vertex shifts, so also compare exactly
+    ref = kdb.Layout()
+    ref.read(str(dirpath / f"{test_name}.gds"))
+    for layer_index in ref.layer_indexes():
+        layer = ref.get_info(layer_index)
+        expected = kdb.Region(ref.top_cell().begin_shapes_rec(layer_index))
+        actual = kdb.Region(
+            component.begin_shapes_rec(component.kcl.layout.layer(layer))
+        )
+        assert (expected ^ actual).is_empty(), layer
+
+
 @pytest.mark.parametrize("component_name", cell_names)
 def test_settings(component_name: str, data_regression: DataRegressionFixture) -> None:
     """Avoid regressions when exporting settings."""
@@ -62,6 +62,7 @@ CELLS_TO_TEST = [
     # Bondpads
     ("bondpad", bondpads_mod.bondpad, {}),
     ("bondpad_array", bondpads_mod.bondpad_array, {}),
+    ("bondpad_array_1pad", bondpads_mod.bondpad_array, {"n_pads": 1}),
     # Via stacks
     ("via_stack", via_mod.via_stack, {}),
     ("via_stack_with_pads", via_mod.via_stack_with_pads, {}),
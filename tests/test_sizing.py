@@ -457,6 +457,46 @@ class TestRfcmim:
             rfcmim(width=7.0, length=TECH.rfcmim_min_size - 0.01)
 
 
+# ---------------------------------------------------------------------------
+# Inductors
+# ---------------------------------------------------------------------------
+class TestInductor2:
+    def test_default_params(self):
+        from ihp.cells.inductors import inductor2
+
+        inductor2()
+
+    def test_diameter_below_min(self):
+        from ihp.cells.inductors import inductor2, inductor_min_diameter
+
+        min_d = inductor_min_diameter(width=2.0, space=2.1, turns=2)
+        with pytest.raises(ValueError, match="inductor diameter"):
+            inductor2(diameter=min_d - 0.1, turns=2)
+
+    def test_min_diameter_on_grid(self):
+        from ihp.cells.inductors import inductor_min_diameter
+
+        assert inductor_min_diameter(width=1.0, space=1.3, turns=2) == 8.7
+
+
+class TestInductor3:
+    def test_default_params(self):
+        from ihp.cells.inductors import inductor3
+
+        inductor3()
+
+    def test_diameter_below_min(self):
+        from ihp.cells.inductors import inductor3
+
+        with pytest.raises(ValueError, match="inductor diameter"):
+            inductor3(diameter=5.0)
+
+    def test_snapped_info(self):
+        from ihp.cells.inductors import inductor3
+
+        assert inductor3(width=2.3).info["width"] == 2.3
+
+
 # ---------------------------------------------------------------------------
 # Passives (taps, sealring)
 # ---------------------------------------------------------------------------